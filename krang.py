@@ -1,36 +1,106 @@
 import os
+import asyncio
+import atexit
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import requests
+from requests.adapters import HTTPAdapter
 import discord
 import random
 import logging
-import math # Needed for format_bytes
 from podman import PodmanClient
 from podman.errors import NotFound
 
 # Constants
 URI = "unix:///run/podman/podman.sock"
-AUTHORIZED_GUILD_IDS = [1317809184221298769, 805070329588088862]
-AUTHORIZED_CHANNEL_IDS = [1319051370686582815, 1317812980074942484]
+
+# Shared Podman client, created lazily on first use and reused for every
+# command so each REST call doesn't pay for a fresh Unix-socket connection.
+# Callers run both on the event loop and on _PODMAN_EXEC worker threads, so
+# creation is guarded by a lock to keep the singleton actually single.
+_podman_client = None
+_podman_client_lock = threading.Lock()
+
+def _get_podman_client():
+    """Return the shared PodmanClient, creating it on first use."""
+    global _podman_client
+    if _podman_client is None:
+        with _podman_client_lock:
+            if _podman_client is None:
+                new_client = PodmanClient(base_url=URI)
+                atexit.register(new_client.close)
+                _podman_client = new_client
+    return _podman_client
+
+# Bounded pool for blocking Podman SDK calls. Running them here instead of
+# directly in a coroutine keeps the event loop free, so gateway heartbeats
+# are never starved while Podman is slow, and commands can overlap.
+_PODMAN_EXEC = ThreadPoolExecutor(max_workers=4, thread_name_prefix="podman")
+
+# Rendered status/stats tables are cached for a few seconds so a burst of
+# identical commands collapses into a single Podman round-trip.
+TABLE_CACHE_TTL = 3.0
+_table_cache = {}
+
+def _get_cached_table(key):
+    """Return a cached rendered table for key, or None if missing/expired."""
+    cached = _table_cache.get(key)
+    if cached and time.monotonic() - cached[0] < TABLE_CACHE_TTL:
+        return cached[1]
+    return None
+
+def _store_cached_table(key, rendered):
+    """Store a rendered table in the cache with the current timestamp."""
+    _table_cache[key] = (time.monotonic(), rendered)
+
+def _invalidate_status_cache():
+    """Drop the cached status table after an action changes container state."""
+    _table_cache.pop(("status", tuple(TARGET_CONTAINERS)), None)
+
+# Frozensets: membership is checked on every inbound message, so use O(1)
+# hash lookups and make it clear these are fixed at startup.
+AUTHORIZED_GUILD_IDS = frozenset({1317809184221298769, 805070329588088862})
+AUTHORIZED_CHANNEL_IDS = frozenset({1319051370686582815, 1317812980074942484})
+
+# The public IP is fetched lazily and cached with a TTL so startup never
+# blocks on ipify and the value refreshes instead of going stale forever.
+PUBLIC_IP_TTL = 300.0
+_public_ip_cache = (None, 0.0)
+
+# Pooled HTTP session so periodic IP refreshes reuse one TCP/TLS connection
+# instead of paying a full handshake per requests.get call.
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
 
 def fetch_public_ip():
     """Fetch the public IP address using api.ipify.org."""
     try:
-        response = requests.get("https://api.ipify.org?format=json")
+        response = _HTTP.get("https://api.ipify.org?format=json", timeout=2)
         response.raise_for_status()
         return response.json().get("ip")
     except requests.RequestException as e:
         logging.error(f"Error fetching public IP: {e}")
-        return "IP Failure" 
+        return "IP Failure"
 
-public_ip = fetch_public_ip()
+def get_public_ip():
+    """Return the cached public IP, refreshing it once the TTL has expired."""
+    global _public_ip_cache
+    value, expiry = _public_ip_cache
+    if value is None or time.monotonic() >= expiry:
+        value = fetch_public_ip()
+        _public_ip_cache = (value, time.monotonic() + PUBLIC_IP_TTL)
+    return value
 
 # Dictionary defining target containers to be managed by the application
 TARGET_CONTAINERS = {
     # Example container setup (currently commented out)
-    # "minecraft": {"ip": PUBLIC_IP, "port": "27015", "password": "serverpasswort"},
+    # "minecraft": {"ip": get_public_ip(), "port": "27015", "password": "serverpasswort"},
 }
 
-KRANG_QUOTES = [ # List of Krang quotes for random responses in the bot
+KRANG_QUOTES = ( # Tuple of Krang quotes for random responses in the bot
     "I'm finally FREE!! The people of this planet will pay for what they've done to me.",
     "Brother, Sister, join me. It's time for us to finish remaking this universe in the image of Krang.",
     "WIPE THAT GRIN OFF YOUR FACE!",
@@ -39,7 +109,21 @@ KRANG_QUOTES = [ # List of Krang quotes for random responses in the bot
     "A word used by the weak. Many planets before yours have spoken of duty. They too have been consumed by the Krang and now our glorious crusade continues to restore the natural order of things. The strong will devour the weak.",
     "A rare misstep. Once I retrieve the key from your comrades, I will bring forth the mighty Technodrome and you will witness the true power of the Krang. Now, where have they taken my key?",
     "Shame our brethren didn't survive the Prison Dimension. Then again, their weakness has no place in my new Krang empire. Open and bring unto this world the mighty power of Krang!"
-]
+)
+
+# Dedicated RNG instance, skips the indirection through random's module state
+_RNG = random.Random()
+
+# Unit suffixes for format_bytes, hoisted so the tuple isn't rebuilt per call
+_SIZE_NAMES = ("B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
+
+# Stats table row layout, bound once so rows don't re-parse the format spec.
+# NAME | CPU % | CPU TIME | MEM USAGE / LIMIT | NET I/O (RX/TX) | BLOCK I/O (R/W)
+_STATS_ROW_FMT = "{:<20} | {:<7} | {:<10} | {:<20} | {:<19} | {:<20}".format
+_STATS_HEADER = _STATS_ROW_FMT(
+    "NAME", "CPU %", "CPU TIME", "MEM USAGE / LIMIT", "NET I/O (RX/TX)", "BLOCK I/O (R/W)"
+)
+_STATS_SEPARATOR = "-" * len(_STATS_HEADER)
 
 # Helper function to format bytes into a human-readable string
 def format_bytes(size_in_bytes):
@@ -48,19 +132,14 @@ def format_bytes(size_in_bytes):
     if size_in_bytes == 0:
         return "0B"
 
-    size_name = ("B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
-    
-    i = 0
-    # Convert to float for division, to handle very small positive numbers correctly if needed
-    temp_size = float(size_in_bytes)
-    while temp_size >= 1024 and i < len(size_name) - 1:
-        temp_size /= 1024
-        i += 1
-        
-    s = round(temp_size, 2)
-    return f"{s}{size_name[i]}"
+    # Units are powers of 1024, so the exponent falls straight out of the
+    # integer bit length: one unit step per 10 bits, clamped to known units.
+    i = max(0, (int(size_in_bytes).bit_length() - 1) // 10)
+    i = min(i, len(_SIZE_NAMES) - 1)
+    s = round(size_in_bytes / (1 << (10 * i)), 2)
+    return f"{s}{_SIZE_NAMES[i]}"
 
-def _format_single_container_stats_row(current_stats, display_name, header_format):
+def _format_single_container_stats_row(current_stats, display_name):
     """Helper function to format a single row of container statistics."""
     cpu_raw = current_stats.get('CPU')
     cpu_display = f"{cpu_raw:.2f}%" if isinstance(cpu_raw, (int, float)) else "N/A"
@@ -77,15 +156,18 @@ def _format_single_container_stats_row(current_stats, display_name, header_forma
     mem_display = f"{format_bytes(current_stats.get('MemUsage', 0))} / {format_bytes(current_stats.get('MemLimit', 0))}"
 
     network_interfaces_stats = current_stats.get('Network') or {}
-    net_rx_bytes = sum(if_data.get('RxBytes', 0) for if_data in network_interfaces_stats.values())
-    net_tx_bytes = sum(if_data.get('TxBytes', 0) for if_data in network_interfaces_stats.values())
+    # Accumulate RX and TX in one pass over the interfaces instead of two
+    net_rx_bytes = net_tx_bytes = 0
+    for if_data in network_interfaces_stats.values():
+        net_rx_bytes += if_data.get('RxBytes', 0)
+        net_tx_bytes += if_data.get('TxBytes', 0)
     net_display = f"{format_bytes(net_rx_bytes)} / {format_bytes(net_tx_bytes)}"
 
     block_input_bytes = current_stats.get('BlockInput', 0)
     block_output_bytes = current_stats.get('BlockOutput', 0)
     block_io_display = f"{format_bytes(block_input_bytes)} / {format_bytes(block_output_bytes)}"
 
-    return header_format.format(
+    return _STATS_ROW_FMT(
         display_name,
         cpu_display,
         cpu_time_display,
@@ -94,79 +176,86 @@ def _format_single_container_stats_row(current_stats, display_name, header_forma
         block_io_display
     )
 
-def get_container_stats_table():
+def _fetch_container_stats_row(container_obj, display_name):
+    """Fetch stats for one container (blocking) and return its table row."""
+    if not container_obj:
+        # Container not found, return a row indicating this
+        return _STATS_ROW_FMT(
+            display_name,
+            "N/A", # CPU %
+            "Not Found", # CPU TIME
+            "N/A", # MEM USAGE / LIMIT
+            "N/A", # NET I/O
+            "N/A"  # BLOCK I/O
+        )
+
+    # Container found, try to get stats
+    try:
+        raw_stats_report = container_obj.stats(decode=True, stream=False)
+
+        if raw_stats_report.get("Error"):
+             raise Exception(f"API Error: {raw_stats_report['Error']}")
+
+        stats_list = raw_stats_report.get("Stats")
+        if not stats_list or not isinstance(stats_list, list) or not stats_list[0]:
+            raise Exception("Stats data missing or in unexpected format")
+
+        current_stats = stats_list[0]
+
+        return _format_single_container_stats_row(current_stats, display_name)
+
+    except Exception as e:
+        # Return an error row if stats cannot be fetched or parsed for this container
+        return _STATS_ROW_FMT(
+            display_name,
+            "Error", # CPU %
+            str(e)[:10], # Truncate error message for CPU TIME column
+            "N/A", # MEM USAGE / LIMIT
+            "N/A", # NET I/O
+            "N/A"  # BLOCK I/O
+        )
+
+async def get_container_stats_table():
     """Fetch and format statistics for containers listed in TARGET_CONTAINERS."""
+    cache_key = ("stats", tuple(TARGET_CONTAINERS))
+    cached = _get_cached_table(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        with PodmanClient(base_url=URI) as client:
-            # Table Header for container stats
-            # NAME | CPU % | CPU TIME | MEM USAGE / LIMIT | NET I/O (RX/TX) | BLOCK I/O (R/W)
-            header_format = "{:<20} | {:<7} | {:<10} | {:<20} | {:<19} | {:<20}"
-            header = header_format.format(
-                "NAME", "CPU %", "CPU TIME", "MEM USAGE / LIMIT", "NET I/O (RX/TX)", "BLOCK I/O (R/W)"
+        client = _get_podman_client()
+        table_rows = []
+
+        table_rows.append(_STATS_HEADER)
+        table_rows.append(_STATS_SEPARATOR)
+
+        # find all containers that match the names in TARGET_CONTAINERS
+        # Use filters to get only the relevant containers efficiently
+        target_names = list(TARGET_CONTAINERS.keys())
+        loop = asyncio.get_running_loop()
+        all_containers = await loop.run_in_executor(
+            _PODMAN_EXEC, partial(client.containers.list, all=True, filters={"name": target_names})
+        )
+
+        # Create a dictionary for quick lookup by name
+        container_dict = {c.name: c for c in all_containers}
+
+        # Fetch stats for all targets concurrently; each stats() call is a
+        # blocking HTTP round-trip, so fan them out to threads and gather.
+        row_tasks = []
+        for target_container_name in target_names:
+            container_obj = container_dict.get(target_container_name)
+            display_name = (target_container_name[:17] + "...") if len(target_container_name) > 20 else target_container_name
+            row_tasks.append(
+                loop.run_in_executor(_PODMAN_EXEC, _fetch_container_stats_row, container_obj, display_name)
             )
-            separator = "-" * len(header)
-            table_rows = []
-
-            table_rows.append(header)
-            table_rows.append(separator)
-
-            # find all containers that match the names in TARGET_CONTAINERS
-            # Use filters to get only the relevant containers efficiently
-            target_names = list(TARGET_CONTAINERS.keys())
-            all_containers = client.containers.list(all=True, filters={"name": target_names})
-            
-            # Create a dictionary for quick lookup by name
-            container_dict = {c.name: c for c in all_containers}
-
-            # Iterate through the target names to ensure all are listed, even if not found
-            for target_container_name in target_names:
-                container_obj = container_dict.get(target_container_name)
-                display_name = (target_container_name[:17] + "...") if len(target_container_name) > 20 else target_container_name
-
-                if not container_obj:
-                    # Container not found, add a row indicating this
-                    error_row = header_format.format(
-                        display_name,
-                        "N/A", # CPU %
-                        "Not Found", # CPU TIME
-                        "N/A", # MEM USAGE / LIMIT
-                        "N/A", # NET I/O
-                        "N/A"  # BLOCK I/O
-                    )
-                    table_rows.append(error_row)
-                    continue # Move to the next target name
-
-                # Container found, try to get stats
-                try:
-                    raw_stats_report = container_obj.stats(decode=True, stream=False)
-
-                    if raw_stats_report.get("Error"):
-                         raise Exception(f"API Error: {raw_stats_report['Error']}")
-
-                    stats_list = raw_stats_report.get("Stats")
-                    if not stats_list or not isinstance(stats_list, list) or not stats_list[0]:
-                        raise Exception("Stats data missing or in unexpected format")
-                    
-                    current_stats = stats_list[0]
-
-                    row_str = _format_single_container_stats_row(current_stats, display_name, header_format)
-                    table_rows.append(row_str)
-
-                except Exception as e:
-                    # Print an error row if stats cannot be fetched or parsed for this container
-                    error_row = header_format.format(
-                        display_name,
-                        "Error", # CPU %
-                        str(e)[:10], # Truncate error message for CPU TIME column
-                        "N/A", # MEM USAGE / LIMIT
-                        "N/A", # NET I/O
-                        "N/A"  # BLOCK I/O
-                    )
-                    table_rows.append(error_row)
-                    # Continue to the next container name
-
-            table_rows.append(separator) # Footer
-            return "\n".join(table_rows)
+
+        table_rows.extend(await asyncio.gather(*row_tasks))
+
+        table_rows.append(_STATS_SEPARATOR) # Footer
+        rendered_table = "\n".join(table_rows)
+        _store_cached_table(cache_key, rendered_table)
+        return rendered_table
 
     except Exception as e:
         logging.error(f"Error fetching container stats: {e}")
@@ -177,75 +266,124 @@ def get_container_stats_table():
 logging.basicConfig(level=logging.INFO)
 
 
+# Status table layout, fixed schema hoisted to module scope like the stats
+# table's: the border/title lines are constants and the row format is bound
+# once instead of re-parsing an f-string per row.
+_STATUS_BORDER = "+-------------------+---------+---------------+--------+------------+"
+_STATUS_TITLES = "| Server/Container  | Status  | IP            | Port   | Password   |"
+_STATUS_ROW_FMT = "| {:<17} | {:<7} | {:<13} | {:<6} | {:<10} |".format
+
 def _generate_status_table(client):
     """Helper function to generate the status table for monitored containers."""
-    table_header = (
-        "+-------------------+---------+---------------+--------+------------+\n"
-        "| Server/Container  | Status  | IP            | Port   | Password   |\n"
-        "+-------------------+---------+---------------+--------+------------+"
+    table_rows = [_STATUS_BORDER, _STATUS_TITLES, _STATUS_BORDER]
+    # Use filters to get only the relevant containers efficiently; the name
+    # filter matches substrings, so the exact-name lookup below still applies.
+    podman_containers_list = client.containers.list(
+        all=True, filters={"name": list(TARGET_CONTAINERS.keys())}
     )
-    table_rows = []
-    podman_containers_list = client.containers.list(all=True)
     # Create a dictionary for quick lookup by exact name
     podman_containers_dict = {c.name: c for c in podman_containers_list}
 
     for name, info in TARGET_CONTAINERS.items():
         container_obj = podman_containers_dict.get(name) # Exact match lookup
         if container_obj:
-            container_obj.reload() # Get fresh status
-            status = container_obj.status if container_obj.status in ["running", "exited"] else "unknown"
+            # The list response already carries the state, but as a plain
+            # string under attrs["State"] — Container.status expects the
+            # inspect shape and blows up on list-sourced attrs — so read
+            # the raw field instead of paying a reload() round-trip.
+            raw_state = container_obj.attrs.get("State")
+            status = raw_state if raw_state in ("running", "exited") else "unknown"
         else:
             status = "not found"
 
-        row = f"| {name:<17} | {status:<7} | {info['ip']:<13} | {info['port']:<6} | {info['password']:<10} |"
+        row = _STATUS_ROW_FMT(name, status, info['ip'], info['port'], info['password'])
         table_rows.append(row)
 
-    table_footer = "+-------------------+---------+---------------+--------+------------+"
-    return f"{table_header}\n" + "\n".join(table_rows) + f"\n{table_footer}"
+    table_rows.append(_STATUS_BORDER) # Footer
+    return "\n".join(table_rows)
+
+def _do_restart(container_obj, container_name):
+    """Restart the container unconditionally."""
+    container_obj.restart()
+    _invalidate_status_cache()
+    return f"Container '{container_name}' restarted successfully."
+
+def _do_start(container_obj, container_name):
+    """Start the container if it is currently exited."""
+    if container_obj.status == "exited":
+        container_obj.start()
+        _invalidate_status_cache()
+        return f"Container '{container_name}' started successfully."
+    return f"Container '{container_name}' is already {container_obj.status}."
+
+def _do_stop(container_obj, container_name):
+    """Stop the container if it is currently running."""
+    if container_obj.status == "running":
+        container_obj.stop()
+        _invalidate_status_cache()
+        return f"Container '{container_name}' stopped successfully."
+    return f"Container '{container_name}' is not running (status: {container_obj.status})."
+
+def _do_logs(container_obj, container_name):
+    """Return the tail of the container's logs, capped to Discord's limit."""
+    logs_iter = container_obj.logs(stdout=True, stderr=True, tail=30)
+    # Collect at most 30 raw lines (defensive, tail already caps),
+    # then decode from the end and stop once the 1900-char reply
+    # budget is filled, so truncated lines are never decoded.
+    raw_lines = deque(logs_iter, maxlen=30)
+    decoded_lines = []
+    total_len = 0
+    for raw_line in reversed(raw_lines):
+        line = raw_line.decode().strip()
+        decoded_lines.append(line)
+        total_len += len(line) + 1  # +1 for the joining newline
+        if total_len > 1900:
+            break
+    log_output = "\n".join(reversed(decoded_lines))
+    return log_output[-1900:] if len(log_output) > 1900 else log_output
+
+# Dispatch table: one hash lookup per command instead of a chain of string
+# comparisons. Every handler takes (container_obj, container_name).
+_ACTION_HANDLERS = {
+    "restart": _do_restart,
+    "start": _do_start,
+    "stop": _do_stop,
+    "logs": _do_logs,
+}
 
 def manage_container(action, container_name=None):
     """Perform actions like start, stop, restart, or check status on containers."""
+    if action == "status":
+        cache_key = ("status", tuple(TARGET_CONTAINERS))
+        cached = _get_cached_table(cache_key)
+        if cached is not None:
+            return cached
+        try:
+            rendered_table = _generate_status_table(_get_podman_client())
+        except Exception as e:
+            logging.error(f"Error during {action} action: {e}")
+            return f"Error performing {action} on container '{container_name}': {e}"
+        _store_cached_table(cache_key, rendered_table)
+        return rendered_table
+
+    # Validate everything before touching the client: container_name present
+    # (should be caught by on_message, but good for robustness), monitored,
+    # and the action known.
+    if not container_name:
+        return f"Please specify a container name for the '{action}' command."
+    if container_name not in TARGET_CONTAINERS:
+        return f"Container '{container_name}' is not in the list of monitored containers or may be misspelled."
+    handler = _ACTION_HANDLERS.get(action)
+    if handler is None:
+        return f"Action '{action}' is unknown or not applicable for container '{container_name}'."
+
+    # One try around the whole Podman interaction; containers.get() inspects
+    # the container, so its status is already fresh for the handler.
     try:
-        with PodmanClient(base_url=URI) as client:
-            if action == "status":
-                return _generate_status_table(client)
-
-            # For actions other than 'status', container_name is required
-            if not container_name: # Should be caught by on_message, but good for robustness
-                return f"Please specify a container name for the '{action}' command."
-
-            if container_name not in TARGET_CONTAINERS:
-                return f"Container '{container_name}' is not in the list of monitored containers or may be misspelled."
-
-            try:
-                container_obj = client.containers.get(container_name)
-                container_obj.reload() # Get fresh status
-            except NotFound:
-                return f"Container '{container_name}' not found by Podman."
-            except Exception as e: # Catch other potential Podman errors
-                logging.error(f"Error getting container '{container_name}': {e}")
-                return f"Error accessing container '{container_name}': {e}"
-
-            if action == "restart":
-                container_obj.restart()
-                return f"Container '{container_name}' restarted successfully."
-            elif action == "start":
-                if container_obj.status == "exited":
-                    container_obj.start()
-                    return f"Container '{container_name}' started successfully."
-                return f"Container '{container_name}' is already {container_obj.status}."
-            elif action == "stop":
-                if container_obj.status == "running":
-                    container_obj.stop()
-                    return f"Container '{container_name}' stopped successfully."
-                return f"Container '{container_name}' is not running (status: {container_obj.status})."
-            elif action == "logs":
-                logs_iter = container_obj.logs(stdout=True, stderr=True, tail=30)
-                log_output = "\n".join(line.decode().strip() for line in logs_iter)
-                return log_output[-1900:] if len(log_output) > 1900 else log_output
-            
-            return f"Action '{action}' is unknown or not applicable for container '{container_name}'."
-
+        container_obj = _get_podman_client().containers.get(container_name)
+        return handler(container_obj, container_name)
+    except NotFound:
+        return f"Container '{container_name}' not found by Podman."
     except Exception as e:
         logging.error(f"Error during {action} action: {e}")
         return f"Error performing {action} on container '{container_name}': {e}"
@@ -257,27 +395,94 @@ intents.message_content = True
 
 client = discord.Client(intents=intents)
 
+# Cached in on_ready so the per-message hot path compares plain ints and
+# substrings instead of going through rich discord.py attribute lookups.
+_bot_user_id = None
+_bot_mention_strings = ()
+
 @client.event
 async def on_ready():
+    global _bot_user_id, _bot_mention_strings
+    _bot_user_id = client.user.id
+    # Discord renders mentions as <@id> or <@!id> depending on nickname
+    _bot_mention_strings = (f"<@{_bot_user_id}>", f"<@!{_bot_user_id}>")
     logging.info(f'We have logged in as {client.user}')
 
+async def _cmd_status(message, command, container_name):
+    status_message = await asyncio.get_running_loop().run_in_executor(
+        _PODMAN_EXEC, manage_container, "status"
+    )
+    await message.channel.send(f"```\n{status_message}\n```")
+
+async def _cmd_logs(message, command, container_name):
+    if not container_name:
+        await message.channel.send("Please specify a container name to fetch logs.")
+        return
+    logs = await asyncio.get_running_loop().run_in_executor(
+        _PODMAN_EXEC, manage_container, "logs", container_name
+    )
+    await message.channel.send(f"```\n{logs}\n```")
+
+async def _cmd_lifecycle(message, command, container_name):
+    if not container_name:
+        await message.channel.send(f"Please specify a container name for the '{command}' command.")
+        return
+    result = await asyncio.get_running_loop().run_in_executor(
+        _PODMAN_EXEC, manage_container, command, container_name
+    )
+    await message.channel.send(result)
+
+async def _cmd_stats(message, command, container_name):
+    stats_message = await get_container_stats_table()
+    await message.channel.send(f"```\n{stats_message}\n```")
+
+async def _cmd_help(message, command, container_name):
+    help_message = (
+        "**Available Commands:**\n"
+        "- `status`: Shows the status of all monitored containers.\n"
+        "- `restart <container_name>`: Restarts the specified container.\n"
+        "- `start <container_name>`: Starts the specified container.\n"
+        "- `stop <container_name>`: Stops the specified container.\n"
+        "- `stats`: Shows resource usage statistics for all monitored containers.\n"
+        "- `logs <container_name>`: Fetches the last 30 lines of logs for the specified container.\n"
+    )
+    await message.channel.send(help_message)
+
+# Command dispatch table, mirroring _ACTION_HANDLERS: a single hash lookup
+# replaces the if/elif chain. Every handler takes (message, command, name).
+_COMMAND_HANDLERS = {
+    "status": _cmd_status,
+    "logs": _cmd_logs,
+    "restart": _cmd_lifecycle,
+    "start": _cmd_lifecycle,
+    "stop": _cmd_lifecycle,
+    "stats": _cmd_stats,
+    "help": _cmd_help,
+}
+
 @client.event
 async def on_message(message):
-    if message.author == client.user:
+    # Cheapest checks first: ignore everything until on_ready has run,
+    # drop our own messages, then require a mention substring before the
+    # guild/channel authorization lookups. The overwhelmingly common case
+    # (chatter that never mentions the bot) exits on a plain "in" check
+    # without iterating message.mentions.
+    if _bot_user_id is None or message.author.id == _bot_user_id:
         return
 
-    # Check if the message is from an authorized server and channel
-    if message.guild.id not in AUTHORIZED_GUILD_IDS or message.channel.id not in AUTHORIZED_CHANNEL_IDS:
+    content = message.content
+    if _bot_mention_strings[0] not in content and _bot_mention_strings[1] not in content:
         return
 
-
-    # Check if bot is mentioned
-    if not message.mentions or client.user not in message.mentions:
+    # Check if the message is from an authorized server and channel
+    if message.guild.id not in AUTHORIZED_GUILD_IDS or message.channel.id not in AUTHORIZED_CHANNEL_IDS:
         return
 
     # Parse command
     try:
-        command_parts = message.content.split()
+        # Bounded split: only the mention, command and argument tokens are
+        # needed, so don't allocate a full token list for long messages.
+        command_parts = message.content.split(None, 3)
         if len(command_parts) < 2:
             await message.channel.send("Invalid command format. Type `help` for instructions.")
             return
@@ -285,42 +490,11 @@ async def on_message(message):
         command = command_parts[1].lower()
         container_name = command_parts[2] if len(command_parts) > 2 else None
 
-        if command == "status":
-            status_message = manage_container("status")
-            await message.channel.send(f"```\n{status_message}\n```")
-
-        elif command == "logs":
-            if not container_name:
-                await message.channel.send("Please specify a container name to fetch logs.")
-                return
-            logs = manage_container("logs", container_name)
-            await message.channel.send(f"```\n{logs}\n```")
-
-        elif command in ["restart", "start", "stop"]:
-            if not container_name:
-                await message.channel.send(f"Please specify a container name for the '{command}' command.")
-                return
-            result = manage_container(command, container_name)
-            await message.channel.send(result)
-
-        elif command == "stats":
-            stats_message = get_container_stats_table()
-            await message.channel.send(f"```\n{stats_message}\n```")
-
-        elif command == "help":
-            help_message = (
-                "**Available Commands:**\n"
-                "- `status`: Shows the status of all monitored containers.\n"
-                "- `restart <container_name>`: Restarts the specified container.\n"
-                "- `start <container_name>`: Starts the specified container.\n"
-                "- `stop <container_name>`: Stops the specified container.\n"
-                "- `stats`: Shows resource usage statistics for all monitored containers.\n"
-                "- `logs <container_name>`: Fetches the last 30 lines of logs for the specified container.\n"
-            )
-            await message.channel.send(help_message)
-
+        handler = _COMMAND_HANDLERS.get(command)
+        if handler:
+            await handler(message, command, container_name)
         else:
-            random_quote = random.choice(KRANG_QUOTES)
+            random_quote = _RNG.choice(KRANG_QUOTES)
             await message.channel.send(random_quote)
 
     except Exception as e: